@@ -12,4 +12,8 @@ class Form(forms.BaseForm):
             choices.append((style, style))
         settings['ALDRYN_EVENTS_PLUGIN_STYLES'] = choices
         settings['INSTALLED_APPS'].append('django_tablib')
+        middleware_key = ('MIDDLEWARE' if 'MIDDLEWARE' in settings
+                          else 'MIDDLEWARE_CLASSES')
+        settings[middleware_key].append(
+            'aldryn_events.middleware.RequestNowMiddleware')
         return settings
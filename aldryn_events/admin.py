@@ -2,7 +2,12 @@
 
 from __future__ import unicode_literals
 
+import csv
+
 from django.contrib import admin
+from django.db.models import Prefetch
+from django.http import HttpResponse
+from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
 from aldryn_apphooks_config.admin import BaseAppHookConfig
@@ -23,16 +28,19 @@ from .forms import EventAdminForm
 
 class EventAdmin(AllTranslationsMixin, FrontendEditableAdminMixin, PlaceholderAdminMixin, TranslatableAdmin):
     form = EventAdminForm
-    search_fields = ('translations__title', )
+    # search against the denormalized title on the shared table; this
+    # avoids joining (and deduplicating over) the translations table
+    search_fields = ('title_default', )
     list_display = (
         'title', 'start_date', 'start_time', 'end_date', 'end_time',
-        'location', 'is_published', 'app_config',
+        'location', 'registration_open', 'is_published', 'app_config',
     )
     list_editable = ('is_published', 'app_config', )
     list_filter = ('is_published', 'app_config', )
     filter_horizontal = ('event_coordinators', )
     date_hierarchy = 'start_date'
     frontend_editable_fields = ('title', 'short_description', 'location')
+    actions = ['export_registrations']
 
     _prepopulated_fields = {"slug": ("title",)}
 
@@ -62,6 +70,35 @@ class EventAdmin(AllTranslationsMixin, FrontendEditableAdminMixin, PlaceholderAd
         })
     )
 
+    def get_queryset(self, request):
+        qs = super(EventAdmin, self).get_queryset(request)
+        # select_related for the one-to-one user, prefetch for the m2m,
+        # so coordinator names/emails don't query per row. The deadline
+        # flag backing the registration_open column is computed in SQL
+        # instead of once per row in Python.
+        return qs.with_registration_status().prefetch_related(
+            Prefetch('event_coordinators',
+                     queryset=EventCoordinator.objects.select_related('user'))
+        )
+
+    def registration_open(self, obj):
+        return not obj.is_registration_deadline_passed
+    registration_open.short_description = _('registration open')
+    registration_open.boolean = True
+
+    def export_registrations(self, request, queryset):
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = (
+            'attachment; filename="registrations.csv"')
+        writer = csv.writer(response)
+        writer.writerow(Registration.objects.EXPORT_FIELDS)
+        event_ids = queryset.values_list('pk', flat=True)
+        for row in Registration.objects.export_rows(event_ids):
+            writer.writerow([force_str(value) for value in row])
+        return response
+    export_registrations.short_description = _(
+        'Export registrations of selected events as CSV')
+
     def get_prepopulated_fields(self, request, obj=None):
         return self._prepopulated_fields
 
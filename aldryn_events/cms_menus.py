@@ -35,16 +35,20 @@ class EventsMenu(CMSAttachMenu):
             if app:
                 events = events.namespace(self.instance.application_namespace)
 
+        # Shared across the loop so the language fallback lookup is done
+        # once instead of once per event.
+        url_cache = {}
         for event in events:
             try:
-                url = event.get_absolute_url(language=language)
+                url = event.get_absolute_url(language=language,
+                                             _cache=url_cache)
             except NoReverseMatch:
                 url = None
 
             if url:
                 node = NavigationNode(
                     event.title,
-                    event.get_absolute_url(language=language),
+                    url,
                     event.pk,
                 )
                 nodes.append(node)
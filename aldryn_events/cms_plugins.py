@@ -118,6 +118,9 @@ class UpcomingPlugin(NameSpaceCheckMixin, AdjustableCacheMixin,
         else:
             events = Event.objects.namespace(namespace).language(language)
             events = events.translated(*self.valid_languages)
+            # past()/upcoming() filter and slice in SQL so only
+            # latest_entries rows load; they also resolve the reference
+            # time themselves and share it across their filters.
             if instance.past_events:
                 events = events.past(count=instance.latest_entries)
             else:
@@ -148,7 +151,8 @@ class EventListCMSPlugin(NameSpaceCheckMixin, CMSPluginBase):
         if instance.language not in self.valid_languages:
             events = Event.objects.none()
         else:
-            events = instance.events.namespace(namespace).language(language)
+            events = instance.get_events().namespace(namespace) \
+                                          .language(language)
             events = events.translated(*self.valid_languages)
         context['events'] = events
         return context
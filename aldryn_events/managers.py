@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from django.db.models import Q
+from django.db import models
+from django.db.models import BooleanField, Case, Q, Value, When
 from django.utils import timezone
 
 from aldryn_apphooks_config.managers.parler import (
@@ -59,6 +60,24 @@ class EventQuerySet(AppHookConfigTranslatableQueryset):
             Q(end_date__isnull=True) | Q(end_date__gte=_date)
         )
 
+    def with_registration_status(self, now=None):
+        """
+        Annotates each event with a ``registration_deadline_passed``
+        boolean, computed in SQL so mass displays (admin changelist,
+        registration lists) don't fall back to the Python property for
+        every row.
+        """
+        now = now or timezone.now()
+        return self.annotate(
+            registration_deadline_passed=Case(
+                When(registration_deadline_at__isnull=True,
+                     then=Value(True)),
+                When(registration_deadline_at__lte=now, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
     def namespace(self, namespace, to=None):
         """
         Overrides the 'normal' namespace QS to also use the 'latest_first'
@@ -74,7 +93,29 @@ class EventQuerySet(AppHookConfigTranslatableQueryset):
 class EventManager(AppHookConfigTranslatableManager):
 
     def get_queryset(self):
-        return EventQuerySet(self.model, using=self.db)
+        # Events are nearly always rendered together with their app_config
+        # (namespace lookup in get_absolute_url) and their translations
+        # (title/slug). Fetching both up-front turns the per-row lookups in
+        # list views, menus and sitemaps into cache hits instead of one
+        # query per event.
+        # List rendering only needs the config's namespace (and its
+        # translated app_title, which lives in a separate table anyway);
+        # defer the wide app_data blob and the placeholder FKs so the
+        # join doesn't drag every EventsConfig column into each row.
+        qs = EventQuerySet(self.model, using=self.db)
+        qs = qs.select_related('app_config').defer(
+            'app_config__app_data',
+            'app_config__placeholder_events_top',
+            'app_config__placeholder_events_sidebar',
+            'app_config__placeholder_events_list_top_ongoing',
+            'app_config__placeholder_events_list_top',
+            'app_config__placeholder_events_detail_top',
+            'app_config__placeholder_events_detail_bottom',
+            'app_config__placeholder_events_detail_footer',
+            'app_config__placeholder_events_registration',
+            'app_config__placeholder_events_registration_footer',
+        )
+        return qs.prefetch_related('translations')
 
     get_query_set = get_queryset
 
@@ -95,3 +136,39 @@ class EventManager(AppHookConfigTranslatableManager):
 
     def ongoing(self, now=None):
         return self.get_queryset().ongoing(now=now)
+
+    def with_registration_status(self, now=None):
+        return self.get_queryset().with_registration_status(now=now)
+
+
+class RegistrationManager(models.Manager):
+
+    EXPORT_FIELDS = (
+        'event_id', 'event__title_default',
+        'salutation', 'first_name', 'last_name', 'email', 'company',
+        'address_zip', 'address_city', 'phone', 'mobile', 'created_at',
+    )
+
+    def export_rows(self, event_ids):
+        """
+        Returns the EXPORT_FIELDS columns for the given events'
+        registrations as plain tuples, ready to stream into
+        ``csv.writer``. The projection runs as a single query and
+        values_list skips hydrating a full model instance per row, which
+        matters for exports of hundreds of registrations. The event pk
+        and denormalized title lead each row so exports spanning several
+        events stay unambiguous.
+        """
+        return self.filter(event_id__in=event_ids).values_list(
+            *self.EXPORT_FIELDS)
+
+
+class EventCoordinatorManager(models.Manager):
+
+    def get_queryset(self):
+        # get_name/get_email_address fall back to the linked user, so
+        # fetch it in the same query instead of once per coordinator.
+        return super(EventCoordinatorManager, self).get_queryset() \
+            .select_related('user')
+
+    get_query_set = get_queryset
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.utils import timezone
+
+try:
+    from django.utils.deprecation import MiddlewareMixin
+except ImportError:  # Django < 1.10
+    MiddlewareMixin = object
+
+
+class RequestNowMiddleware(MiddlewareMixin):
+    """
+    Stamps each request with a single reference datetime.
+
+    timezone.now() builds a freshly localized datetime on every call;
+    pages rendering many events (deadline checks per event) can share
+    the request's value instead. Optional: code reading ``request._now``
+    falls back to timezone.now() when the middleware is not installed.
+    """
+
+    def process_request(self, request):
+        request._now = timezone.now()
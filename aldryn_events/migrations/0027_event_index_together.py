@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_events', '0026_auto_20180112_1738'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='event',
+            index_together=set([
+                ('app_config', 'is_published', 'start_date', 'start_time'),
+            ]),
+        ),
+    ]
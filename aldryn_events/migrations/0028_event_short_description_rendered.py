@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def render_short_descriptions(apps, schema_editor):
+    from djangocms_text_ckeditor.html import clean_html
+
+    EventTranslation = apps.get_model('aldryn_events', 'EventTranslation')
+    translations = EventTranslation.objects.exclude(short_description='')
+    for translation in translations.iterator():
+        translation.short_description_rendered = clean_html(
+            translation.short_description, full=False)
+        translation.save(update_fields=['short_description_rendered'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_events', '0027_event_index_together'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventtranslation',
+            name='short_description_rendered',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(
+            render_short_descriptions, migrations.RunPython.noop),
+    ]
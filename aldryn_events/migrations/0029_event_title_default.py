@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_title_default(apps, schema_editor):
+    Event = apps.get_model('aldryn_events', 'Event')
+    EventTranslation = apps.get_model('aldryn_events', 'EventTranslation')
+    language_code = getattr(settings, 'LANGUAGE_CODE', 'en')
+    for event in Event.objects.all().iterator():
+        translations = EventTranslation.objects.filter(master_id=event.pk)
+        translation = (translations.filter(language_code=language_code)
+                       .first() or translations.first())
+        if translation is not None:
+            Event.objects.filter(pk=event.pk).update(
+                title_default=translation.title)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_events', '0028_event_short_description_rendered'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='title_default',
+            field=models.CharField(
+                db_index=True, default='', editable=False, max_length=150),
+        ),
+        migrations.RunPython(
+            populate_title_default, migrations.RunPython.noop),
+    ]
@@ -1,34 +1,102 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import datetime
+
 from django.core.exceptions import ValidationError
 from django.core.urlresolvers import reverse
 from django.db import models
 from django.utils import timezone
 from django.utils.encoding import force_str
-from django.utils.translation import override, gettext_lazy as _, gettext
+from django.utils.translation import override, gettext_lazy as _
 
 from cms.models import CMSPlugin
 from cms.models.fields import PlaceholderField
-from cms.utils.i18n import get_current_language, get_redirect_on_fallback
+from cms.utils.i18n import (
+    get_current_language, get_fallback_languages, get_redirect_on_fallback,
+)
 
 from aldryn_translation_tools.models import (
     TranslationHelperMixin, TranslatedAutoSlugifyMixin,
 )
 from djangocms_text_ckeditor.fields import HTMLField
+from djangocms_text_ckeditor.html import clean_html
 from extended_choices import Choices
 from filer.fields.image import FilerImageField
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import (
+    TranslatableModel, TranslatedFields, TranslationDoesNotExist,
+)
 from sortedm2m.fields import SortedManyToManyField
 
 from .cms_appconfig import EventsConfig
 from .conf import settings
-from .managers import EventManager
+from .managers import (
+    EventCoordinatorManager, EventManager, RegistrationManager,
+)
 from .utils import get_additional_styles, date_or_datetime
 
 STANDARD = 'standard'
 
 
+def _validate_date_order(event):
+    if (event.start_date and event.end_date and
+            event.end_date < event.start_date):
+        raise ValidationError(_('Start date should be before end date.'))
+
+
+def _validate_same_day_times(event):
+    # dates are equal, check time
+    if not (event.start_date and event.end_date):
+        return
+    if event.start_date != event.end_date:
+        return
+    # check that time is provided
+    if not (event.end_time and event.start_time):
+        raise ValidationError(
+            _('When specifying identical start and end dates, '
+              'please also provide the start and end time.'))
+    # check time validity
+    if (event.end_time < event.start_time or
+            event.start_time == event.end_time):
+        raise ValidationError(
+            _('For same start and end dates start time '
+              'should be before end time.'))
+
+
+def _validate_registration_link_conflict(event):
+    if event.enable_registration and event.register_link:
+        raise ValidationError(
+            _("the registration system can't be active if there is "
+              "an external registration link. please remove at least one "
+              "of the two.")
+        )
+
+
+def _validate_registration_deadline(event):
+    if event.enable_registration and not event.registration_deadline_at:
+        raise ValidationError(_("please select a registration deadline."))
+
+
+# Flat list iterated by Event.clean; bulk import code can extend or
+# swap this without monkey-patching the method itself.
+_EVENT_VALIDATORS = [
+    _validate_date_order,
+    _validate_same_day_times,
+    _validate_registration_link_conflict,
+    _validate_registration_deadline,
+]
+
+
+def _coerce_date(value, field):
+    # Dates (and datetimes) pass through without touching the field's
+    # to_python machinery; only raw strings need the full normalization.
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return field.to_python(value)
+
+
 class Event(TranslatedAutoSlugifyMixin,
             TranslationHelperMixin,
             TranslatableModel):
@@ -69,6 +137,12 @@ class Event(TranslatedAutoSlugifyMixin,
     description = PlaceholderField(
         'aldryn_events_event_description', verbose_name=_('description'),
     )
+    # Denormalized copy of the (any-language) title on the shared table,
+    # kept in sync on save. Sorting and searching against it avoids the
+    # OUTER JOIN to the translations table.
+    title_default = models.CharField(
+        max_length=150, db_index=True, default='', editable=False
+    )
 
     translations = TranslatedFields(
         title=models.CharField(
@@ -81,6 +155,11 @@ class Event(TranslatedAutoSlugifyMixin,
             _('short description'), blank=True, default='',
             help_text=_('translated')
         ),
+        # Denormalized copy of short_description, sanitized once on save
+        # so templates don't re-clean the HTML on every render.
+        short_description_rendered=models.TextField(
+            blank=True, default='', editable=False
+        ),
         location=models.TextField(_('location'), blank=True, default=''),
         location_lat=models.FloatField(
             _('location latitude'), blank=True, null=True
@@ -108,6 +187,14 @@ class Event(TranslatedAutoSlugifyMixin,
         #     `managers.EventsQuerySet.namespace()`
         # which reverses this ordering when the option is set.
         ordering = ('start_date', 'start_time', 'end_date', 'end_time')
+        # Composite index matching the hottest filter + order pattern
+        # (namespace()/published() followed by the date ordering) so list
+        # views can stream rows in index order instead of sorting. The
+        # reversed 'latest_first' ordering is served by the same index
+        # via a backward scan.
+        index_together = (
+            ('app_config', 'is_published', 'start_date', 'start_time'),
+        )
 
     def get_title(self):
         return self.safe_translation_getter('title', any_language=True)
@@ -127,36 +214,24 @@ class Event(TranslatedAutoSlugifyMixin,
         return self.end()
 
     def clean(self):
-        # there is a start date and end date
-        if self.start_date and self.end_date:
-            if self.end_date < self.start_date:
-                raise ValidationError(
-                    _('Start date should be before end date.'))
-
-            # dates are equal, check time
-            if self.start_date == self.end_date:
-                # check that time is provided
-                if not (self.end_time and self.start_time):
-                    raise ValidationError(
-                        _('When specifying identical start and end dates, '
-                          'please also provide the start and end time.'))
-
-                # check time validity
-                if (self.end_time < self.start_time or
-                        self.start_time == self.end_time):
-                    raise ValidationError(
-                        _('For same start and end dates start time '
-                          'should be before end time.'))
-
-        if self.enable_registration and self.register_link:
-            raise ValidationError(
-                _("the registration system can't be active if there is "
-                  "an external registration link. please remove at least one "
-                  "of the two.")
-            )
+        for validator in _EVENT_VALIDATORS:
+            validator(self)
 
-        if self.enable_registration and not self.registration_deadline_at:
-            raise ValidationError(_("please select a registration deadline."))
+    def save(self, *args, **kwargs):
+        # Sanitize the short description once here rather than on every
+        # render; templates serve short_description_rendered directly.
+        try:
+            short_description = self.short_description
+        except TranslationDoesNotExist:
+            pass
+        else:
+            self.short_description_rendered = (
+                clean_html(short_description, full=False)
+                if short_description else ''
+            )
+        self.title_default = self.safe_translation_getter(
+            'title', any_language=True) or ''
+        super(Event, self).save(*args, **kwargs)
 
     def start(self):
         return date_or_datetime(self.start_date, self.start_time)
@@ -174,49 +249,129 @@ class Event(TranslatedAutoSlugifyMixin,
 
         :return: number of days
         """
+        # Templates hit this repeatedly per event (takes_single_day,
+        # calendar/list rendering), so memoize per instance, keyed on the
+        # current date values so that changing the dates recomputes.
+        cached = self.__dict__.get('_days_cache')
+        if cached is not None and cached[0] == (self.start_date,
+                                                self.end_date):
+            return cached[1]
+
         # Need to normalize values to date objects cuz it can be strings
         # and Django does not normalize in some situations, like when
         # using 'Event.objects.create'
-        start_date_field = self._meta.get_field('start_date')
-        end_date_field = self._meta.get_field('end_date')
-        self.start_date = start_date_field.to_python(self.start_date)
+        self.start_date = _coerce_date(self.start_date, _START_DATE_FIELD)
         if self.end_date:
-            self.end_date = end_date_field.to_python(self.end_date)
+            self.end_date = _coerce_date(self.end_date, _END_DATE_FIELD)
 
         end_date = self.end_date or self.start_date
-        return (end_date - self.start_date).days + 1
+        days = (end_date - self.start_date).days + 1
+        self.__dict__['_days_cache'] = ((self.start_date, self.end_date),
+                                        days)
+        return days
 
     @property
     def takes_single_day(self):
         """ True if event take a single day, else False """
         return self.days == 1
 
+    def registration_deadline_is_passed(self, now=None):
+        """
+        Same check as is_registration_deadline_passed, but callers that
+        already hold a reference time (e.g. request._now from
+        RequestNowMiddleware) can pass it in instead of paying for a
+        fresh timezone.now() per event.
+        """
+        # Prefer the SQL-computed value from
+        # EventQuerySet.with_registration_status() when present.
+        annotated = self.__dict__.get('registration_deadline_passed')
+        if annotated is not None:
+            return annotated
+        now = now or timezone.now()
+        return not (self.registration_deadline_at and
+                    self.registration_deadline_at > now)
+
     @property
     def is_registration_deadline_passed(self):
-        return not (self.registration_deadline_at and
-                    self.registration_deadline_at > timezone.now())
+        return self.registration_deadline_is_passed()
 
     def get_url_name(self):
-        try:
-            url_name = '{0}:events_detail'.format(self.app_config.namespace)
-        except AttributeError:
+        # Checking app_config_id avoids both an extra attribute chain and
+        # the exception machinery of the old try/except AttributeError;
+        # the result is invariant per instance, so memoize it.
+        cached = self.__dict__.get('_url_name')
+        if cached is not None:
+            return cached
+        namespace = self.app_config.namespace if self.app_config_id else None
+        if namespace:
+            url_name = '{0}:events_detail'.format(namespace)
+        else:
             url_name = 'aldryn_events:events_detail'
-
+        self.__dict__['_url_name'] = url_name
         return url_name
 
-    def get_absolute_url(self, language=None):
-
+    def _known_slug_from_prefetch(self, language):
+        """
+        Resolve (slug, language_code) from the ``translations`` prefetch
+        cache, honouring the same language preference order as
+        ``known_translation_getter``. Returns (None, None) when the
+        instance was fetched without ``prefetch_related('translations')``
+        so callers can fall back to parler's per-instance lookup.
+        """
+        prefetched = getattr(self, '_prefetched_objects_cache', None)
+        if prefetched is None or 'translations' not in prefetched:
+            return None, None
+
+        translations = {
+            translation.language_code: translation
+            for translation in prefetched['translations']
+        }
+        site_id = getattr(settings, 'SITE_ID', None)
+        candidates = [language] + get_fallback_languages(
+            language, site_id=site_id)
+        for code in candidates:
+            translation = translations.get(code)
+            if translation is not None and translation.slug:
+                return translation.slug, code
+        return None, None
+
+    def get_absolute_url(self, language=None, _cache=None):
+        """
+        Build the URL of the event detail view.
+
+        The result is memoized on the instance per language, because list
+        views, menus and the language changer ask for the same URL several
+        times per render. Callers iterating over many events can addition-
+        ally pass a shared ``_cache`` dict to compute the language fallback
+        lookup only once per loop instead of once per event; note that
+        ``reverse()`` results are deliberately not cached process-wide as
+        apphook URLs can be re-wired at runtime.
+        """
         if not language:
             language = get_current_language()
 
+        memo = self.__dict__.setdefault('_url_cache', {})
+        memo_key = language
+        if memo_key in memo:
+            return memo[memo_key]
+
+        if _cache is None:
+            _cache = {}
+
         kwargs = {}
-        slug, slug_lang = self.known_translation_getter(
-            'slug', default=None, language_code=language)
+        slug, slug_lang = self._known_slug_from_prefetch(language)
+        if slug is None:
+            slug, slug_lang = self.known_translation_getter(
+                'slug', default=None, language_code=language)
 
         kwargs.update(slug=slug)
         if slug and slug_lang:
-            site_id = getattr(settings, 'SITE_ID', None)
-            if get_redirect_on_fallback(language, site_id):
+            redirect_key = ('redirect_on_fallback', language)
+            if redirect_key not in _cache:
+                site_id = getattr(settings, 'SITE_ID', None)
+                _cache[redirect_key] = get_redirect_on_fallback(
+                    language, site_id)
+            if _cache[redirect_key]:
                 language = slug_lang
 
         if self.app_config_id and self.app_config.namespace:
@@ -225,7 +380,15 @@ class Event(TranslatedAutoSlugifyMixin,
             namespace = ''
 
         with override(language):
-            return reverse('{0}events_detail'.format(namespace), kwargs=kwargs)
+            url = reverse('{0}events_detail'.format(namespace), kwargs=kwargs)
+        memo[memo_key] = url
+        return url
+
+
+# Field references are invariant for the lifetime of the class; capture
+# them once here instead of a _meta.get_field() lookup per days access.
+_START_DATE_FIELD = Event._meta.get_field('start_date')
+_END_DATE_FIELD = Event._meta.get_field('end_date')
 
 
 class EventCoordinator(models.Model):
@@ -239,6 +402,8 @@ class EventCoordinator(models.Model):
         blank=True,
     )
 
+    objects = EventCoordinatorManager()
+
     def __str__(self):
         return self.full_name or self.email_address
 
@@ -270,8 +435,10 @@ class EventCoordinator(models.Model):
 
 class Registration(models.Model):
     SALUTATIONS = Choices(
-        ('SALUTATION_FEMALE', 'mrs', gettext('Ms.')),
-        ('SALUTATION_MALE', 'mr', gettext('Mr.')),
+        # lazy: resolved on first render and cached by the translation
+        # catalog, instead of reading the catalog at import time
+        ('SALUTATION_FEMALE', 'mrs', _('Ms.')),
+        ('SALUTATION_MALE', 'mr', _('Mr.')),
     )
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -307,6 +474,8 @@ class Registration(models.Model):
 
     message = models.TextField(_('Message'), blank=True, default='')
 
+    objects = RegistrationManager()
+
     @property
     def address_street(self):
         return self.address
@@ -339,22 +508,40 @@ class EventListPlugin(BaseEventPlugin):
 
     style = models.CharField(
         verbose_name=_('Style'),
-        choices=STYLE_CHOICES + get_additional_styles(),
+        choices=STYLE_CHOICES + list(get_additional_styles()),
         default=STANDARD,
         max_length=50
     )
     events = SortedManyToManyField(Event, blank=True)
 
     def __str__(self):
-        return force_str(self.pk)
+        return str(self.pk)
+
+    def get_events(self):
+        """
+        The plugin's events with the relations list rendering needs
+        (app_config, translations) fetched up-front, so rendering stays
+        at a constant number of queries regardless of plugin size.
+        """
+        return (self.events.select_related('app_config')
+                           .prefetch_related('translations'))
 
     def copy_relations(self, oldinstance):
         super(EventListPlugin, self).copy_relations(oldinstance)
-        # With Django 1.5 and because a bug in SortedManyToManyField
-        # we can not use oldinstance.events or we get a error like:
-        # DatabaseError:
-        #   no such column: aldryn_events_eventlistplugin_events.sort_value
-        self.events = Event.objects.filter(eventlistplugin__pk=oldinstance.pk)
+        # Copy the sort rows directly through the m2m table instead of
+        # assigning to the SortedManyToManyField descriptor, which would
+        # issue one INSERT per event. This is one SELECT plus one bulk
+        # INSERT regardless of how many events the plugin holds, and it
+        # keeps the sort_value of every row intact.
+        through = self.events.through
+        pairs = through.objects.filter(
+            eventlistplugin_id=oldinstance.pk,
+        ).values_list('event_id', 'sort_value')
+        through.objects.bulk_create([
+            through(eventlistplugin_id=self.pk, event_id=event_id,
+                    sort_value=sort_value)
+            for event_id, sort_value in pairs
+        ])
 
 
 class UpcomingPluginItem(BaseEventPlugin):
@@ -376,7 +563,7 @@ class UpcomingPluginItem(BaseEventPlugin):
     )
     style = models.CharField(
         verbose_name=_('Style'),
-        choices=STYLE_CHOICES + get_additional_styles(),
+        choices=STYLE_CHOICES + list(get_additional_styles()),
         default=STANDARD,
         max_length=50
     )
@@ -411,4 +598,4 @@ class EventCalendarPlugin(BaseEventPlugin):
     )
 
     def __str__(self):
-        return force_str(self.pk)
+        return str(self.pk)
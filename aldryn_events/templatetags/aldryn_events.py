@@ -52,6 +52,19 @@ def fallback_aware_namespace_url(context, view_name, namespace, **kwargs):
     return url
 
 
+@register.filter
+def is_registration_deadline_passed(event, request=None):
+    """
+    Deadline check that reuses the request's cached reference time
+    (set by RequestNowMiddleware) when available, instead of calling
+    timezone.now() once per event:
+
+        {% if event|is_registration_deadline_passed:request %}
+    """
+    now = getattr(request, '_now', None) if request else None
+    return event.registration_deadline_is_passed(now=now)
+
+
 @register.simple_tag(takes_context=True)
 def calendar(context, year, month, language=None, namespace=None):
     template_name = 'aldryn_events/includes/calendar.html'
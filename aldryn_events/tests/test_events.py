@@ -267,3 +267,36 @@ class EventTestCase(EventBaseTestCase):
         )
         event.save()
         self.assertEqual(event.slug, 'gotchaa')
+
+    def test_title_default_synced_on_save(self):
+        with force_language('en'):
+            event = Event.objects.create(
+                title='Concert',
+                start_date=tz_datetime(2015, 2, 4),
+                app_config=self.app_config,
+            )
+        event = Event.objects.get(pk=event.pk)
+        self.assertEqual(event.title_default, 'Concert')
+
+        with force_language('en'):
+            event.title = 'Open-air concert'
+            event.save()
+        event = Event.objects.get(pk=event.pk)
+        self.assertEqual(event.title_default, 'Open-air concert')
+
+    def test_short_description_rendered_synced_on_save(self):
+        with force_language('en'):
+            event = Event.objects.create(
+                title='Workshop',
+                start_date=tz_datetime(2015, 2, 4),
+                app_config=self.app_config,
+                short_description='<p>A <strong>short</strong> one.</p>'
+            )
+        event = Event.objects.language('en').get(pk=event.pk)
+        self.assertIn('<strong>short</strong>',
+                      event.short_description_rendered)
+
+        event.short_description = ''
+        event.save()
+        event = Event.objects.language('en').get(pk=event.pk)
+        self.assertEqual(event.short_description_rendered, '')
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import override
-from aldryn_events.models import Event
+from aldryn_events.models import Event, Registration
 from cms import api
 
 from .base import EventBaseTestCase, tz_datetime
@@ -103,6 +105,33 @@ class TestEventsManager(EventManagerTestCase):
         expected2 = [event.pk for event in [self.ev7, self.ev1]]
         self.assertEqual(actual2, expected2)
 
+    def test_with_registration_status(self):
+        now = tz_datetime(2014, 4, 7)
+        open_event = self.create_event(
+            title='registration open',
+            start_date=tz_datetime(2014, 4, 9),
+            enable_registration=True,
+            registration_deadline_at=tz_datetime(2014, 4, 8),
+        )
+        closed_event = self.create_event(
+            title='registration closed',
+            start_date=tz_datetime(2014, 4, 9),
+            enable_registration=True,
+            registration_deadline_at=tz_datetime(2014, 4, 6),
+        )
+        events = {event.pk: event for event in
+                  Event.objects.with_registration_status(now=now)}
+        # a NULL deadline means registration was never open
+        self.assertTrue(events[self.ev1.pk].registration_deadline_passed)
+        self.assertTrue(events[closed_event.pk].registration_deadline_passed)
+        self.assertFalse(events[open_event.pk].registration_deadline_passed)
+        # the instance check must reuse the annotation instead of
+        # recomputing against timezone.now()
+        self.assertFalse(
+            events[open_event.pk].registration_deadline_is_passed())
+        self.assertTrue(
+            events[closed_event.pk].is_registration_deadline_passed)
+
     def test_upcoming(self):
         now = tz_datetime(2014, 4, 7)
         entries = Event.objects
@@ -116,6 +145,39 @@ class TestEventsManager(EventManagerTestCase):
         self.assertEqual(actual2, expected2)
 
 
+class TestRegistrationManager(EventBaseTestCase):
+
+    def test_export_rows_returns_export_columns_per_event(self):
+        event = self.create_event(
+            title='exported', start_date=tz_datetime(2014, 4, 5))
+        other_event = self.create_event(
+            title='not exported', start_date=tz_datetime(2014, 4, 6))
+        Registration.objects.create(
+            event=event, first_name='Felipe', last_name='Somename',
+            email='felipe@example.com', address_zip='00000',
+            address_city='São Paulo')
+        Registration.objects.create(
+            event=other_event, first_name='Someone', last_name='Else',
+            email='someone@example.com', address_zip='11111',
+            address_city='Berlin')
+
+        rows = list(Registration.objects.export_rows([event.pk]))
+        self.assertEqual(len(rows), 1)
+        row = dict(zip(Registration.objects.EXPORT_FIELDS, rows[0]))
+        self.assertEqual(row['event_id'], event.pk)
+        self.assertEqual(row['event__title_default'], 'exported')
+        self.assertEqual(row['first_name'], 'Felipe')
+        self.assertEqual(row['email'], 'felipe@example.com')
+        self.assertEqual(row['address_city'], 'São Paulo')
+
+        # several events export in one query, rows tagged per event
+        with self.assertNumQueries(1):
+            rows = list(Registration.objects.export_rows(
+                [event.pk, other_event.pk]))
+        self.assertEqual(
+            sorted(row[0] for row in rows), [event.pk, other_event.pk])
+
+
 class EventManagerAppConfigTestCase(EventBaseTestCase):
     """
     Please add this TO THE LEFT of EventManagerTestCase if used with it.
@@ -166,6 +228,31 @@ class TestEventsAppConfigManager(EventManagerAppConfigTestCase,
             self.assertLess(content.find(self.oldest_first[e].title),
                             content.find(self.oldest_first[e + 1].title))
 
+    def test_title_and_url_rendering_uses_constant_queries(self):
+        """
+        The default manager select_relates app_config and prefetches
+        translations, so resolving the title and absolute url of every
+        event must not issue additional queries per event.
+        """
+        def render():
+            events = Event.objects.namespace(self.app_config.namespace)
+            return [(event.get_title(), event.get_absolute_url())
+                    for event in events]
+
+        with CaptureQueriesContext(connection) as context:
+            render()
+        num_queries = len(context.captured_queries)
+
+        for day in (21, 22, 23):
+            self.create_event(
+                title='event on day {0}'.format(day),
+                start_date=tz_datetime(2014, 4, day),
+            )
+
+        with CaptureQueriesContext(connection) as context:
+            render()
+        self.assertEqual(len(context.captured_queries), num_queries)
+
     def test_latest_first_ordering(self):
         """
         Ensure that events are ordered latest-first when app is configured
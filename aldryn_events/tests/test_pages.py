@@ -270,7 +270,7 @@ class EventPagesTestCase(EventBaseTestCase):
         self.create_base_pages()
         ev1, ev2, ev3, ev4, ev5, ev6, ev7 = self.setUpForEventListPages()
         url = reverse(
-            "aldryn_events:events_list-by-day",
+            "aldryn_events:events_list",
             kwargs={'year': 2014, 'month': 3, 'day': 7}
         )
         with force_language('en'):
@@ -286,7 +286,7 @@ class EventPagesTestCase(EventBaseTestCase):
         self.create_base_pages()
         ev1, ev2, ev3, ev4, ev5, ev6, ev7 = self.setUpForEventListPages()
         url = reverse(
-            "aldryn_events:events_list-by-month",
+            "aldryn_events:events_list",
             kwargs={'year': 2014, 'month': 3}
         )
         with force_language('en'):
@@ -303,7 +303,7 @@ class EventPagesTestCase(EventBaseTestCase):
         self.create_base_pages()
         ev1, ev2, ev3, ev4, ev5, ev6, ev7 = self.setUpForEventListPages()
         url = reverse(
-            "aldryn_events:events_list-by-year",
+            "aldryn_events:events_list",
             kwargs={'year': 2014}
         )
         with force_language('en'):
@@ -229,6 +229,37 @@ class EventPluginsTestCase(TestPluginLanguageHelperMixin, EventBaseTestCase):
             self.assertContains(response, event2.title)
             self.assertContains(response, event2.get_absolute_url())
 
+    def test_event_list_plugin_copy_relations_keeps_order(self):
+        """
+        Copying an event list plugin (e.g. on page copy/publish) must
+        keep the manually sorted event order, which is stored in the
+        through table's sort_value.
+        """
+        event1 = self.create_event(
+            title='first', start_date=tz_datetime(2014, 9, 10))
+        event2 = self.create_event(
+            title='second', start_date=tz_datetime(2014, 9, 11))
+        event3 = self.create_event(
+            title='third', start_date=tz_datetime(2014, 9, 12))
+        # deliberately not the natural (date) ordering
+        ordered = [event3, event1, event2]
+
+        ph = Placeholder.objects.create(slot='content')
+        plugin = api.add_plugin(
+            ph, 'EventListCMSPlugin', 'en', app_config=self.app_config,
+        )
+        plugin.events = ordered
+        plugin.save()
+
+        copied = api.add_plugin(
+            ph, 'EventListCMSPlugin', 'en', app_config=self.app_config,
+        )
+        copied.copy_relations(plugin)
+        self.assertEqual(
+            [event.pk for event in copied.events.all()],
+            [event.pk for event in ordered]
+        )
+
     def test_event_list_plugin_languages(self):
         def populate_event_list_plugin(plugin):
             plugin.events = [self.create_obj_with_translation()]
@@ -681,7 +712,7 @@ class TestCalendarPluginFallback(LanguageFallbackMixin, EventBaseTestCase):
             'month': date.month,
             'day': date.day}
         url = reverse(
-            '{0}:events_list-by-day'.format(app_config.namespace),
+            '{0}:events_list'.format(app_config.namespace),
             kwargs=kwargs)
         return url
 
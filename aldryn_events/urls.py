@@ -4,15 +4,19 @@ from django.conf.urls import url
 from aldryn_events.views import event_list, event_dates, event_list_archive, event_detail, reset_event_registration
 
 urlpatterns = [
-    url(r'^$', event_list, name='events_list'),
+    # Single patterns with optional nested groups replace the former
+    # per-year/month/day variants, so the resolver tries one regex per
+    # view instead of linearly attempting six near-identical ones.
+    # reverse() enumerates the optional groups, so the names below work
+    # with any of the year / year+month / year+month+day kwarg sets.
+    url(r'^(?:(?P<year>\d{4})(?:/(?P<month>\d{1,2})(?:/(?P<day>\d{1,2}))?)?/)?$',
+        event_list, name='events_list'),
     url(r'^get-dates/$', event_dates, name='get-calendar-dates'),
     url(r'^get-dates/(?P<year>[0-9]+)/(?P<month>[0-9]+)/$', event_dates, name='get-calendar-dates'),
-    url(r'^(?P<year>\d{4})/$', event_list, name='events_list-by-year'),
-    url(r'^(?P<year>\d{4})/(?P<month>\d{1,2})/$', event_list, name='events_list-by-month'),
-    url(r'^(?P<year>\d{4})/(?P<month>\d{1,2})/(?P<day>\d{1,2})/$', event_list, name='events_list-by-day'),
-    url(r'^archive/$', event_list_archive, name='events_list_archive'),
-    url(r'^archive/(?P<year>\d{4})/$', event_list_archive, name='events_list_archive-by-year'),
-    url(r'^archive/(?P<year>\d{4})/(?P<month>\d{1,2})/$', event_list_archive, name='events_list_archive-by-month'),
-    url(r'^(?P<slug>[\w_-]+)/$', event_detail, name='events_detail'),
+    url(r'^archive(?:/(?P<year>\d{4})(?:/(?P<month>\d{1,2}))?)?/$',
+        event_list_archive, name='events_list_archive'),
+    # The lookahead rules out the reserved prefixes up-front instead of
+    # letting the slug pattern match and backtrack on them.
+    url(r'^(?!archive/|get-dates/)(?P<slug>[\w_-]+)/$', event_detail, name='events_detail'),
     url(r'^(?P<slug>[\w_-]+)/reset/$', reset_event_registration, name='events_registration_reset'),
 ]
@@ -10,6 +10,7 @@ from django.core.urlresolvers import reverse, NoReverseMatch
 from django.db.models import Q
 from django.template.loader import render_to_string
 from django.utils import timezone
+from django.utils.lru_cache import lru_cache
 try:
     from collections import OrderedDict
 except ImportError:
@@ -152,9 +153,14 @@ def send_manager_confirmation_email(registration, language, emails):
         send_mail(subject, body, settings.DEFAULT_FROM_EMAIL, emails)
 
 
+@lru_cache(maxsize=1)
 def get_additional_styles():
     """
     Get additional styles choices from settings
+
+    The setting can't change within a process, so the result is computed
+    once and returned as a tuple (cached values must not be mutated by
+    callers).
     """
     choices = []
     raw = getattr(settings, 'ALDRYN_EVENTS_PLUGIN_STYLES', False)
@@ -171,7 +177,7 @@ def get_additional_styles():
                 choices.append((clean.lower(), clean.title()))
             except Exception:
                 pass
-    return choices
+    return tuple(choices)
 
 
 def get_monthdates(month, year):
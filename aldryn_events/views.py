@@ -49,6 +49,9 @@ class NavigationMixin(object):
         qs = (Event.objects.namespace(self.namespace)
                            .active_translations(self.request_language)
                            .language(self.request_language))
+        # the navigation only needs titles and dates;
+        # don't drag the description placeholder along
+        qs = qs.defer('description')
         events_by_year = build_events_by_year(qs.future())
         context['events_by_year'] = events_by_year
         archived_events_by_year = build_events_by_year(qs.archive(),
@@ -76,8 +79,13 @@ class EventListView(AppConfigMixin, NavigationMixin, ListView):
         if not EventsConfig.objects.filter(namespace=self.namespace).exists():
             qs = Event.objects.none()
         else:
+            # List templates never render the description placeholder
+            # (that's detail-view only), so defer its column instead of
+            # risking N placeholder/plugin lookups in the loop. The
+            # detail view keeps the full fetch.
             qs = (super(EventListView, self).get_queryset()
-                                            .namespace(self.namespace))
+                                            .namespace(self.namespace)
+                                            .defer('description'))
         if not self.request.GET.get('all_languages', False):
             qs = qs.active_translations(self.request_language).language(
                 self.request_language)
@@ -36,6 +36,9 @@ HELPER_SETTINGS = {
         'django_tablib',
         'aldryn_events',
     ],
+    'MIDDLEWARE_CLASSES': [
+        'aldryn_events.middleware.RequestNowMiddleware',
+    ],
     'CMS_PERMISSION': True,
     'LANGUAGES': (
         ('en', 'English'),